@@ -46,8 +46,9 @@ def export(connector: "intents.DialogflowEsConnector", output_path: str, agent_n
     with open(os.path.join(output_dir, 'package.json'), 'w') as f:
         json.dump({"version": "1.0.0"}, f, indent=2)
 
+    intents_language_data = language.agent_intent_language_data(agent_cls)
     for intent in agent_cls.intents:
-        language_data = language.intent_language_data(agent_cls, intent)
+        language_data = intents_language_data[intent.name]
         rendered_intent = render_intent(connector, intent, language_data)
         with open(os.path.join(intents_dir, f"{intent.name}.json"), "w") as f:
             json.dump(asdict(rendered_intent), f, indent=2)
@@ -215,7 +216,7 @@ def render_responses(intent_cls: _IntentMetaclass, language_data: Dict[language.
 
         for response_group, responses in language_code_data.responses.items():
             assert response_group in [language.IntentResponseGroup.DEFAULT, language.IntentResponseGroup.RICH]
-            if response_group == language.IntentResponseGroup.RICH:
+            if response_group is language.IntentResponseGroup.RICH:
                 platforms_to_render = rich_platforms
             else:
                 platforms_to_render = (None,) # Dialogflow will put the response in "Default" when platform=None
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import List, Dict
 from dataclasses import dataclass
 
@@ -7,6 +8,7 @@ import yaml
 from intents.model.entity import _EntityMetaclass
 from intents.language.language_codes import LanguageCode
 from intents.language.agent_language import agent_language_folder
+from intents.language.intent_language import YamlLoader
 
 @dataclass
 class EntityEntry:
@@ -33,11 +35,26 @@ def entity_language_data(agent_cls: "agent._AgentMetaclass", entity_cls: _Entity
         return result
 
     language_file = os.path.join(language_folder, language_code.value, f"ENTITY_{entity_cls.name}.yaml")
-    if not os.path.isfile(language_file):
-        raise ValueError(f"Language file not found for entity '{entity_cls.name}'. Expected path: {language_file}.")
+    try:
+        file_stat = os.stat(language_file)
+    except FileNotFoundError as exc:
+        raise ValueError(f"Language file not found for entity '{entity_cls.name}'. Expected path: {language_file}.") from exc
 
-    with open(language_file, 'r') as f:
-        language_data = yaml.load(f.read(), Loader=yaml.FullLoader)
+    # Copy the cached list, so that callers can't change it
+    entries = _load_entity_language_file(language_file, file_stat.st_mtime_ns, file_stat.st_size, entity_cls)
+    return {language_code: list(entries)}
+
+@lru_cache(maxsize=1024)
+def _load_entity_language_file(language_file: str, mtime_ns: int, size: int, entity_cls: _EntityMetaclass) -> List[EntityEntry]:
+    """
+    Parse a single Entity language file. As for Intents, results are cached
+    and `mtime_ns` and `size` are part of the cache key.
+    """
+    if not size:
+        return []
+
+    with open(language_file, 'rb') as f:
+        language_data = yaml.load(f, Loader=YamlLoader)
 
     if not language_data:
         return []
@@ -52,4 +69,4 @@ def entity_language_data(agent_cls: "agent._AgentMetaclass", entity_cls: _Entity
             raise ValueError(f"Invalid language data for entry {entity_cls.name}. Synonims data must always be lists. Synonims data for '{value}': '{synonyms}'")
         entries.append(EntityEntry(value, synonyms))
 
-    return {language_code: entries}
+    return entries
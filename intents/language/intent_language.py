@@ -51,12 +51,21 @@ Let's look at the sections of this file.
 
 import os
 import re
+import copy
 from enum import Enum
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import List, Dict, Union
 
 import yaml
 
+# libyaml bindings are much faster than the pure-Python parser; fall back to
+# the latter when PyYAML was built without them.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError: # pragma: no cover
+    from yaml import SafeLoader as YamlLoader
+
 from intents.language import agent_language, LanguageCode
 from intents.model.entity import _EntityMetaclass
 
@@ -69,12 +78,15 @@ class UtteranceChunk:
     An Example Utterance can be seen as a sequence of Chunks, where each Chunk
     is either a mapped Entity, or a plain text string.
     """
+    __slots__ = ()
 
 @dataclass
 class TextUtteranceChunk(UtteranceChunk):
     """
     An Utterance Chunk that is a static, plain text string.
     """
+    __slots__ = ('text',)
+
     text: str
 
 @dataclass
@@ -82,6 +94,8 @@ class EntityUtteranceChunk(UtteranceChunk):
     """
     An Utterance Chunk that is a matched entity
     """
+    __slots__ = ('entity_cls', 'parameter_name', 'parameter_value')
+
     entity_cls: _EntityMetaclass
     parameter_name: str
     parameter_value: str
@@ -97,12 +111,12 @@ class ExampleUtterance(str):
     # TODO: check for escape characters - intent is possibly intent_cls
     def __init__(self, example: str, intent: "intents.Intent"):
         self._intent = intent
-        self.chunks() # Will check parameters
+        self._chunks = self._parse_chunks() # Will check parameters
     
     def __new__(cls, example: str, intent: "intents.Intent"):
         return super().__new__(cls, example)
 
-    def chunks(self):
+    def chunks(self) -> List[UtteranceChunk]:
         """
         Return the Utterance as a sequence of :class:`UtteranceChunk`. Each
         chunk is either a plain text string, or a mapped Entity.
@@ -115,32 +129,44 @@ class ExampleUtterance(str):
             TextUtteranceChunk(text="!")
         ]
 
+        Chunks are computed once, when the Utterance is created.
+        """
+        return self._chunks
+
+    def _parse_chunks(self) -> List[UtteranceChunk]:
+        """
+        Split the Utterance into chunks, checking that referenced parameters
+        are defined by the Intent.
+
         TODO: handle escaping
         """
+        # Most examples have no parameters: skip the regex altogether
+        if '$' not in self:
+            return [TextUtteranceChunk(text=str(self))] if self else []
+
         parameter_schema = self._intent.parameter_schema()
-        result = []
-        last_end = 0
-        for m in RE_EXAMPLE_PARAMETERS.finditer(self):
-            m_start, m_end = m.span()
-            m_groups = m.groupdict()
-            if m_start > 0:
-                result.append(TextUtteranceChunk(text=self[last_end:m_start]))
-            
-            if (parameter_name := m_groups['parameter_name']) not in parameter_schema:
+
+        # Splitting on a pattern with two groups yields
+        # [text, name, value, text, name, value, ..., text]
+        parts = RE_EXAMPLE_PARAMETERS.split(self)
+        texts, parameter_names, parameter_values = parts[0::3], parts[1::3], parts[2::3]
+
+        for parameter_name in parameter_names:
+            if parameter_name not in parameter_schema:
                 raise ValueError(f"Example '{self}' references parameter ${parameter_name}, but intent {self._intent.name} does not define such parameter.")
- 
-            entity_cls = parameter_schema[parameter_name].entity_cls
+
+        result = []
+        for text, parameter_name, parameter_value in zip(texts, parameter_names, parameter_values):
+            if text:
+                result.append(TextUtteranceChunk(text=text))
             result.append(EntityUtteranceChunk(
-                entity_cls=entity_cls,
-                parameter_name=m_groups['parameter_name'],
-                parameter_value=m_groups['parameter_value']
+                entity_cls=parameter_schema[parameter_name].entity_cls,
+                parameter_name=parameter_name,
+                parameter_value=parameter_value
             ))
 
-            last_end = m_end
-
-        last_chunk = TextUtteranceChunk(text=self[last_end:])
-        if last_chunk.text:
-            result.append(last_chunk)
+        if texts[-1]:
+            result.append(TextUtteranceChunk(text=texts[-1]))
 
         return result
 
@@ -235,9 +261,9 @@ class QuickRepliesIntentResponse(IntentResponse):
     replies: List[str]
 
     def __post_init__(self):
-        for rep in self.replies:
-            if len(rep) > 20:
-                raise ValueError(f"Quick Replies must be shorter than 20 chars. Quick reply '{rep}' is {len(rep)} chars long.")
+        longest = max(self.replies, key=len, default='')
+        if len(longest) > 20:
+            raise ValueError(f"Quick Replies must be shorter than 20 chars. Quick reply '{longest}' is {len(longest)} chars long.")
 
     @classmethod
     def from_yaml(cls, data: Union[str, List[str]]):
@@ -387,41 +413,119 @@ def intent_language_data(
         language_folder = agent_language.agent_language_folder(agent_cls)
 
         if not language_code:
-            result = {}
-            for language_code in agent_cls.languages:
-                language_data = intent_language_data(agent_cls, intent_cls, language_code)
-                result[language_code] = language_data[language_code]
-            return result
-
-        if isinstance(language_code, str):
-            language_code = LanguageCode(language_code)
-
-        language_file = os.path.join(language_folder, language_code.value, f"{intent_cls.name}.yaml")
-        if not os.path.isfile(language_file):
-            raise ValueError(f"Language file not found for intent '{intent_cls.name}'. Expected path: {language_file}. Language files are required even if the intent doesn't need language; in this case, use an empty file.")
-        
-        with open(language_file, 'r') as f:
-            language_data = yaml.load(f.read(), Loader=yaml.FullLoader)
+            language_codes = agent_cls.languages
+        elif isinstance(language_code, str):
+            language_codes = [LanguageCode(language_code)]
+        else:
+            language_codes = [language_code]
 
-        if not language_data:
-            return IntentLanguageData([], {}, [])
+        result = {}
+        for language_code in language_codes:
+            result[language_code] = _intent_language_file_data(language_folder, intent_cls, language_code)
 
-        examples_data = language_data.get('examples', [])
-        responses_data = language_data.get('responses', [])
+        return result
+    except Exception as e:
+        raise _language_data_error(intent_cls) from e
 
-        examples = [ExampleUtterance(s, intent_cls) for s in examples_data]
-        responses = _build_responses(responses_data)
-        
-        language_data = IntentLanguageData(
-            example_utterances=examples,
-            slot_filling_prompts=language_data.get('slot_filling_prompts', {}),
-            responses=responses
-        )
+def agent_intent_language_data(
+    agent_cls: "intents.model.agent._AgentMetaclass"
+) -> Dict[str, Dict[LanguageCode, IntentLanguageData]]:
+    """
+    Load language data for all the Intents that are registered in the given
+    Agent. The result maps intent names to the same structure that is returned
+    by :func:`intent_language_data`.
+
+    This is equivalent to calling :func:`intent_language_data` for each
+    Intent, but the agent language folder is resolved only once.
+    """
+    language_folder = agent_language.agent_language_folder(agent_cls)
+
+    result = {}
+    for intent_cls in agent_cls.intents or []:
+        try:
+            result[intent_cls.name] = {
+                language_code: _intent_language_file_data(language_folder, intent_cls, language_code)
+                for language_code in agent_cls.languages
+            }
+        except Exception as e:
+            raise _language_data_error(intent_cls) from e
+
+    return result
+
+def _intent_language_file_data(
+    language_folder: str,
+    intent_cls: "intents.model.intent._IntentMetaclass",
+    language_code: LanguageCode
+) -> IntentLanguageData:
+    language_file = os.path.join(language_folder, language_code.value, f"{intent_cls.name}.yaml")
+    try:
+        file_stat = os.stat(language_file)
+    except FileNotFoundError as exc:
+        raise _language_file_not_found(intent_cls, language_file) from exc
+
+    language_data = _load_intent_language_file(language_file, file_stat.st_mtime_ns, file_stat.st_size, intent_cls)
+    return _copy_language_data(language_data)
+
+def _copy_language_data(language_data: IntentLanguageData) -> IntentLanguageData:
+    """
+    Cached language data is shared between callers: give each of them its own
+    containers, so that changes don't leak into the cache. Example utterances
+    and (frozen) responses themselves are shared.
+    """
+    return IntentLanguageData(
+        example_utterances=list(language_data.example_utterances),
+        slot_filling_prompts=copy.deepcopy(language_data.slot_filling_prompts),
+        responses={group: list(responses) for group, responses in language_data.responses.items()}
+    )
+
+def _language_data_error(intent_cls: "intents.model.intent._IntentMetaclass") -> RuntimeError:
+    return RuntimeError(f"Failed to load language data for intent {intent_cls.name} (see stacktrace above for root cause).")
+
+def _language_file_not_found(intent_cls: "intents.model.intent._IntentMetaclass", language_file: str) -> ValueError:
+    return ValueError(f"Language file not found for intent '{intent_cls.name}'. Expected path: {language_file}. Language files are required even if the intent doesn't need language; in this case, use an empty file.")
+
+@lru_cache(maxsize=4096)
+def _load_intent_language_file(
+    language_file: str,
+    mtime_ns: int,
+    size: int,
+    intent_cls: "intents.model.intent._IntentMetaclass"
+) -> IntentLanguageData:
+    """
+    Parse a single Intent language file. Results are cached: `mtime_ns` and
+    `size` are part of the cache key, so that a file is parsed again only when
+    it changes.
+    """
+    # Trigger-only intents may have an empty language file
+    if not size:
+        return IntentLanguageData([], {}, {})
+
+    with open(language_file, 'rb') as f:
+        language_data = yaml.load(f, Loader=YamlLoader)
+
+    if not language_data:
+        return IntentLanguageData([], {}, {})
+
+    examples_data = language_data.get('examples', [])
+    responses_data = language_data.get('responses', {})
+
+    examples = [ExampleUtterance(s, intent_cls) for s in examples_data]
+    responses = _build_responses(responses_data)
+
+    return IntentLanguageData(
+        example_utterances=examples,
+        slot_filling_prompts=language_data.get('slot_filling_prompts', {}),
+        responses=responses
+    )
 
-        return {language_code: language_data}
-    except Exception as e:
-        raise RuntimeError(f"Failed to load language data for intent {intent_cls.name} (see stacktrace above for root cause).") from e
 
+_RESPONSE_BUILDERS = {
+    'text': TextIntentResponse.from_yaml,
+    'quick_replies': QuickRepliesIntentResponse.from_yaml,
+    'image': ImageIntentResponse.from_yaml,
+    'card': CardIntentResponse.from_yaml,
+    'custom': CustomPayloadIntentResponse.from_yaml
+}
 
 def _build_responses(responses_data: dict):
     result = {}
@@ -434,24 +538,16 @@ def _build_responses(responses_data: dict):
         except ValueError as exc:
             raise NotImplementedError(f"Unsupported Response Group '{response_group}' in 'responses'. Currently, only 'default' and 'rich' are supported") from exc
 
-        result[response_group] = []
+        group_result = result[response_group] = []
         for r in responses:
             assert len(r) == 1
             for r_type, r_data in r.items():
-                if response_group == IntentResponseGroup.DEFAULT and r_type != 'text':
+                if response_group is IntentResponseGroup.DEFAULT and r_type != 'text':
                     raise ValueError(f"Message type {r_type} found in response group 'default'. Only 'text' type is allowed in 'default': please define the additional 'rich' response group to use rich responses.")
 
-                if r_type == 'text':
-                    result[response_group].append(TextIntentResponse.from_yaml(r_data))
-                elif r_type == 'quick_replies':
-                    result[response_group].append(QuickRepliesIntentResponse.from_yaml(r_data))
-                elif r_type == 'image':
-                    result[response_group].append(ImageIntentResponse.from_yaml(r_data))
-                elif r_type == 'card':
-                    result[response_group].append(CardIntentResponse.from_yaml(r_data))
-                elif r_type == 'custom':
-                    result[response_group].append(CustomPayloadIntentResponse.from_yaml(r_data))
-                else:
-                    raise NotImplementedError(f"Unsupported response type '{r_type}'. Currently, only 'text' is supported")
+                builder = _RESPONSE_BUILDERS.get(r_type)
+                if not builder:
+                    raise NotImplementedError(f"Unsupported response type '{r_type}'. Currently, only {list(_RESPONSE_BUILDERS)} are supported")
+                group_result.append(builder(r_data))
                 
     return result
@@ -1,6 +1,34 @@
 import pytest
+from example_agent import smalltalk
+from intents import Sys
+from intents.language.intent_language import ExampleUtterance, TextUtteranceChunk, EntityUtteranceChunk
 from intents.language.intent_language import TextIntentResponse, QuickRepliesIntentResponse, ImageIntentResponse, CardIntentResponse, CustomPayloadIntentResponse
 
+def test_example_utterance_chunks():
+    utterance = ExampleUtterance("My name is $user_name{Guido}!", smalltalk.user_name_give)
+    assert utterance.chunks() == [
+        TextUtteranceChunk(text="My name is "),
+        EntityUtteranceChunk(entity_cls=Sys.Person, parameter_name="user_name", parameter_value="Guido"),
+        TextUtteranceChunk(text="!")
+    ]
+
+def test_example_utterance_chunks_adjacent_parameters():
+    utterance = ExampleUtterance("$friend_names{Al}$friend_names{John}", smalltalk.greet_friends)
+    assert utterance.chunks() == [
+        EntityUtteranceChunk(entity_cls=Sys.Person, parameter_name="friend_names", parameter_value="Al"),
+        EntityUtteranceChunk(entity_cls=Sys.Person, parameter_name="friend_names", parameter_value="John")
+    ]
+
+def test_example_utterance_chunks_no_parameters():
+    utterance = ExampleUtterance("Hello", smalltalk.hello)
+    assert utterance.chunks() == [TextUtteranceChunk(text="Hello")]
+    assert type(utterance.chunks()[0].text) is str
+    assert ExampleUtterance("", smalltalk.hello).chunks() == []
+
+def test_example_utterance_unknown_parameter():
+    with pytest.raises(ValueError):
+        ExampleUtterance("My name is $foo{Guido}", smalltalk.user_name_give)
+
 def test_text_intent_response_string():
     text_response_instance = TextIntentResponse(["ciao"])
     text_response_from_yaml = TextIntentResponse.from_yaml("ciao")
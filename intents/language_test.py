@@ -1,5 +1,7 @@
 import os
 import tempfile
+import pytest
+from contextlib import contextmanager
 from unittest.mock import patch
 
 from intents import Agent
@@ -34,16 +36,25 @@ def _toy_language_folder(dir_name, intent_name, languages=('en',)):
         with open(os.path.join(lang_dir, intent_name + ".yaml"), 'w') as f:
             print(TOY_LANGUAGE_FILE, file=f)
 
-def test_intent_data_all_languages():
+@contextmanager
+def _patched_language_folder():
+    """
+    Create a temporary agent language folder, and make the language loader read
+    from it.
+    """
     with tempfile.TemporaryDirectory() as tmp_dir:
-        _toy_language_folder(tmp_dir, 'test_intent', ['en'])
         class mock_agent_language_module:
             @staticmethod
             def agent_language_folder(agent_cls):
                 return tmp_dir
 
         with patch('intents.language.intent_language.agent_language', mock_agent_language_module):
-            result = language.intent_language_data(MockAgentClass, MockIntentClass)
+            yield tmp_dir
+
+def test_intent_data_all_languages():
+    with _patched_language_folder() as tmp_dir:
+        _toy_language_folder(tmp_dir, 'test_intent', ['en'])
+        result = language.intent_language_data(MockAgentClass, MockIntentClass)
 
     assert language.LanguageCode.ENGLISH in result
     assert isinstance(result[language.LanguageCode.ENGLISH], language.IntentLanguageData)
@@ -59,6 +70,87 @@ def test_intent_data_all_languages():
         ]
     }
 
+def test_intent_data_cached_until_file_changes():
+    with _patched_language_folder() as tmp_dir:
+        _toy_language_folder(tmp_dir, 'test_intent', ['en'])
+        first = language.intent_language_data(MockAgentClass, MockIntentClass, language.LanguageCode.ENGLISH)
+        second = language.intent_language_data(MockAgentClass, MockIntentClass, language.LanguageCode.ENGLISH)
+        assert first[language.LanguageCode.ENGLISH] == second[language.LanguageCode.ENGLISH]
+        assert first[language.LanguageCode.ENGLISH].example_utterances[0] is second[language.LanguageCode.ENGLISH].example_utterances[0]
+
+        language_file = os.path.join(tmp_dir, 'en', 'test_intent.yaml')
+        with open(language_file, 'w') as f:
+            print("examples:\n  - Howdy", file=f)
+        stat = os.stat(language_file)
+        os.utime(language_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        third = language.intent_language_data(MockAgentClass, MockIntentClass, language.LanguageCode.ENGLISH)
+
+    assert third[language.LanguageCode.ENGLISH].example_utterances == [
+        language.ExampleUtterance("Howdy", MockIntentClass)
+    ]
+
+def test_intent_data_cache_not_modified_by_callers():
+    with _patched_language_folder() as tmp_dir:
+        _toy_language_folder(tmp_dir, 'test_intent', ['en'])
+        first = language.intent_language_data(MockAgentClass, MockIntentClass)[language.LanguageCode.ENGLISH]
+        first.example_utterances.clear()
+        first.slot_filling_prompts['x'] = ["What is x?"]
+        first.responses.clear()
+        second = language.intent_language_data(MockAgentClass, MockIntentClass)[language.LanguageCode.ENGLISH]
+
+    assert len(second.example_utterances) == 2
+    assert second.slot_filling_prompts == {}
+    assert language.IntentResponseGroup.DEFAULT in second.responses
+
+def test_intent_data_empty_file():
+    with _patched_language_folder() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, 'en'))
+        open(os.path.join(tmp_dir, 'en', 'test_intent.yaml'), 'w').close()
+        result = language.intent_language_data(MockAgentClass, MockIntentClass)
+
+    assert result == {
+        language.LanguageCode.ENGLISH: language.IntentLanguageData([], {}, {})
+    }
+
+def test_agent_intent_language_data():
+    class MockAgentWithIntents(Agent):
+        languages = ['en', 'it']
+        intents = [MockIntentClass]
+
+    with _patched_language_folder() as tmp_dir:
+        _toy_language_folder(tmp_dir, 'test_intent', ['en', 'it'])
+        result = language.agent_intent_language_data(MockAgentWithIntents)
+        expected = language.intent_language_data(MockAgentWithIntents, MockIntentClass)
+
+    assert result == {'test_intent': expected}
+
+def test_agent_intent_language_data_missing_language_folder():
+    class MockAgentWithIntents(Agent):
+        languages = ['en', 'it']
+        intents = [MockIntentClass]
+
+    with _patched_language_folder() as tmp_dir:
+        _toy_language_folder(tmp_dir, 'test_intent', ['en'])
+        with pytest.raises(RuntimeError):
+            language.agent_intent_language_data(MockAgentWithIntents)
+
+def test_entity_data_cache_not_modified_by_callers():
+    class MockEntityClass:
+        name = 'test_entity'
+        custom_language_data = None
+
+    with _patched_language_folder() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, 'en'))
+        with open(os.path.join(tmp_dir, 'en', 'ENTITY_test_entity.yaml'), 'w') as f:
+            print("entries:\n  pizza:\n    - pie", file=f)
+        with patch('intents.language.entity_language.agent_language_folder', lambda agent_cls: tmp_dir):
+            language.entity_language_data(MockAgentClass, MockEntityClass)[language.LanguageCode.ENGLISH].clear()
+            result = language.entity_language_data(MockAgentClass, MockEntityClass)
+
+    assert result == {
+        language.LanguageCode.ENGLISH: [language.EntityEntry("pizza", ["pie"])]
+    }
+
 # def test_intent_data_skips_private_folders():
 #     ...
 
@@ -1,9 +1,11 @@
+import os
 from unittest.mock import patch, call
 
 import pytest
 
 from intents import Agent, Sys, Intent, Entity
 from intents import language
+from intents.language_test import _patched_language_folder
 from example_agent import smalltalk
 
 real_LanguageCode = language.LanguageCode
@@ -44,6 +46,27 @@ def test_register_intent_invalid_language_data(mock_language):
     with pytest.raises(ValueError):
         MyAgent._register_intent(smalltalk.hello)
 
+class bad_language_intent(Intent):
+    """Intent used to test language data checks at registration"""
+    name = "test.bad_language_intent"
+    user_name: Sys.Person
+
+def _register_with_language_file(content: str):
+    MyAgent = _get_toy_agent()
+    with _patched_language_folder() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, 'en'))
+        with open(os.path.join(tmp_dir, 'en', 'test.bad_language_intent.yaml'), 'w') as f:
+            f.write(content)
+        MyAgent.register(bad_language_intent)
+
+def test_register_intent_invalid_example():
+    with pytest.raises(RuntimeError):
+        _register_with_language_file("examples:\n  - Hi, I'm $not_a_param{Guido}\n")
+
+def test_register_intent_invalid_response():
+    with pytest.raises(RuntimeError):
+        _register_with_language_file("responses:\n  default:\n    - quick_replies: Hello\n")
+
 @patch('intents.model.agent.language')
 def test_register_intent_registers_entities(mock_language):
     mock_language.LanguageCode = real_LanguageCode
@@ -11,22 +11,30 @@ class with :meth:`intents.Agent.register`.
 """
 
 import re
+import sys
 import logging
 import dataclasses
-from dataclasses import dataclass, is_dataclass
-from typing import List, Dict, Any, _GenericAlias
+from types import MappingProxyType
+from dataclasses import dataclass, MISSING
+from typing import List, Tuple, Dict, Mapping, Any, get_origin, get_args
 
 from intents.model import context, event, entity
 from intents import language
 
 logger = logging.getLogger(__name__)
 
+_RE_VALID_INTENT_NAME = re.compile(r'(?![_.])(?!.*__)[a-zA-Z_\.]*')
+_RE_INVALID_NAME_CHARS = re.compile(r'[^a-zA-Z_\.]')
+_RE_REPEATED_UNDERSCORES = re.compile(r'_+')
+
 #
 # Intent
 #
 
 @dataclass
 class IntentParameterMetadata:
+    __slots__ = ('name', 'entity_cls', 'is_list', 'required', 'default')
+
     name: str
     entity_cls: entity._EntityMetaclass
     is_list: bool
@@ -38,7 +46,7 @@ class _IntentMetaclass(type):
     name: str = None
     input_contexts: List[context._ContextMetaclass] = None
     output_contexts: List[context.Context] = None
-    events: List[event.Event] = None # TODO: at some point this may contain strings
+    events: Tuple[event.Event, ...] = None # TODO: at some point this may contain strings
 
     def __new__(cls, name, bases, dct):
         result_cls = super().__new__(cls, name, bases, dct)
@@ -55,6 +63,9 @@ class _IntentMetaclass(type):
             if not is_valid:
                 raise ValueError(f"Invalid intent name '{result_cls.name}': {reason}")
 
+        # Intent and event names are used as dict keys throughout the library
+        result_cls.name = sys.intern(result_cls.name)
+
         if not result_cls.input_contexts:
             result_cls.input_contexts = []
         if not result_cls.output_contexts:
@@ -64,16 +75,13 @@ class _IntentMetaclass(type):
         # TODO: check language data
         # language.intent_language_data(cls, result) # Checks that language data is existing and consistent
 
-        events = [_system_event(result_cls.name)]
-        for event_cls in result_cls.__dict__.get('events', []):
-            events.append(event_cls)
-        result_cls.events = events
+        result_cls.events = (_system_event(result_cls.name), *result_cls.__dict__.get('events', ()))
 
-        if not is_dataclass(result_cls):
-            result_cls = dataclass(result_cls)
+        # Always process the class: subclasses may add fields to their parent's
+        result_cls = dataclass(result_cls)
 
-        # Check parameters
-        result_cls.parameter_schema()
+        # Computing the schema also checks parameter types
+        result_cls.__parameter_schema__ = MappingProxyType(_build_parameter_schema(result_cls))
 
         return result_cls
 
@@ -138,7 +146,7 @@ class Intent(metaclass=_IntentMetaclass):
     name: str = None
     input_contexts: List[context._ContextMetaclass] = None
     output_contexts: List[context.Context] = None
-    events: List[event.Event] = None # TODO: at some point this may contain strings
+    events: Tuple[event.Event, ...] = None # TODO: at some point this may contain strings
 
     # A :class:`Connector` provides this
     prediction: 'intents.Prediction'
@@ -183,58 +191,20 @@ class Intent(metaclass=_IntentMetaclass):
         [TextIntentResponse(choices=['Nice, I can send you holiday pictures, or recommend an hotel'])]
         
         """
-        if response_group == language.IntentResponseGroup.RICH and \
-           not self.prediction.fulfillment_messages.get(response_group):
-            response_group = language.IntentResponseGroup.DEFAULT
-
+        # Fallback from RICH to DEFAULT is resolved when the Prediction is built
         return self.prediction.fulfillment_messages.get(response_group, [])
 
     @classmethod
-    def parameter_schema(cls) -> Dict[str, IntentParameterMetadata]:
+    def parameter_schema(cls) -> Mapping[str, IntentParameterMetadata]:
         """
-        Return a dict representing the Intent parameter definition. A key is a
-        parameter name, a value is a :class:`IntentParameterMetadata` object.
+        Return a read-only mapping representing the Intent parameter definition.
+        A key is a parameter name, a value is a :class:`IntentParameterMetadata`
+        object.
 
-        TODO: consider computing this in metaclass to cache value and check types
+        The schema is computed (and checked) once, when the Intent class is
+        defined.
         """
-        result = {}
-        for param_field in cls.__dict__['__dataclass_fields__'].values():
-            # List[...]
-            if isinstance(param_field.type, _GenericAlias):
-                if param_field.type.__dict__.get('_name') != 'List':
-                    raise ValueError(f"Invalid typing '{param_field.type}' for parameter '{param_field.name}'. Only 'List' is supported.")
-
-                if len(param_field.type.__dict__.get('__args__')) != 1:
-                    raise ValueError(f"Invalid List modifier '{param_field.type}' for parameter '{param_field.name}'. Must define exactly one inner type (e.g. 'List[Sys.Integer]')")
-                
-                # From here on, check the inner type (e.g. List[Sys.Integer] -> Sys.Integer)
-                entity_cls = param_field.type.__dict__.get('__args__')[0]
-                is_list = True
-            else:
-                entity_cls = param_field.type
-                is_list = False
-
-            required = True
-            default = None
-            if not isinstance(param_field.default, dataclasses._MISSING_TYPE):
-                required = False
-                default = param_field.default
-            if not isinstance(param_field.default_factory, dataclasses._MISSING_TYPE):
-                required = False
-                default = param_field.default_factory()
-
-            if not required and is_list and not isinstance(default, list):
-                raise ValueError(f"List parameter has non-list default value in intent {cls}: {param_field}")
-
-            result[param_field.name] = IntentParameterMetadata(
-                name=param_field.name,
-                entity_cls=entity_cls,
-                is_list=is_list,
-                required=required,
-                default=default
-            )
-
-        return result
+        return cls.__dict__['__parameter_schema__']
 
     @classmethod
     def from_prediction(cls, prediction: 'intents.Prediction') -> 'Intent':
@@ -257,23 +227,71 @@ class Intent(metaclass=_IntentMetaclass):
         result.prediction = prediction
         return result
 
+def _build_parameter_schema(intent_cls: _IntentMetaclass) -> Dict[str, IntentParameterMetadata]:
+    """
+    Compute the parameter schema of the given Intent class from its dataclass
+    fields. This is run once by the metaclass; use
+    :meth:`Intent.parameter_schema` to read the result.
+    """
+    result = {}
+    for param_field in dataclasses.fields(intent_cls):
+        type_origin = get_origin(param_field.type)
+        # List[...] (or list[...])
+        if type_origin is list:
+            type_args = get_args(param_field.type)
+            if len(type_args) != 1:
+                raise ValueError(f"Invalid List modifier '{param_field.type}' for parameter '{param_field.name}'. Must define exactly one inner type (e.g. 'List[Sys.Integer]')")
+            
+            # From here on, check the inner type (e.g. List[Sys.Integer] -> Sys.Integer)
+            entity_cls = type_args[0]
+            is_list = True
+        elif type_origin is not None:
+            raise ValueError(f"Invalid typing '{param_field.type}' for parameter '{param_field.name}'. Only 'list' / 'List' is supported.")
+        else:
+            entity_cls = param_field.type
+            is_list = False
+
+        required = True
+        default = None
+        if param_field.default is not MISSING:
+            required = False
+            default = param_field.default
+        if param_field.default_factory is not MISSING:
+            required = False
+            default = param_field.default_factory()
+
+        if not required and is_list and not isinstance(default, list):
+            raise ValueError(f"List parameter has non-list default value in intent {intent_cls}: {param_field}")
+
+        result[param_field.name] = IntentParameterMetadata(
+            name=param_field.name,
+            entity_cls=entity_cls,
+            is_list=is_list,
+            required=required,
+            default=default
+        )
+
+    return result
+
 def _is_valid_intent_name(candidate_name):
-    if re.search(r'[^a-zA-Z_\.]', candidate_name):
+    if _RE_VALID_INTENT_NAME.fullmatch(candidate_name):
+        return True, None
+
+    # Invalid name: find out why
+    if _RE_INVALID_NAME_CHARS.search(candidate_name):
         return False, "must only contain letters, underscore or dot"
 
     if candidate_name.startswith('.') or candidate_name.startswith('_'):
         return False, "must start with a letter"
 
-    if "__" in candidate_name:
-        return False, "must not contain __"
-
-    return True, None
+    assert "__" in candidate_name
+    return False, "must not contain __"
 
 def _intent_name_from_class(intent_cls: _IntentMetaclass) -> str:
     full_name = f"{intent_cls.__module__}.{intent_cls.__name__}"
     if "__" in full_name:
         logger.warning("Intent class '%s' contains repeated '_'. This is reserved: repeated underscores will be reduced to one, this may cause unexpected behavior.")
-    full_name = re.sub(r"_+", "_", full_name)
+    full_name = _RE_REPEATED_UNDERSCORES.sub("_", full_name)
     return ".".join(full_name.split(".")[-2:])
 
 def _system_event(intent_name: str) -> str:
@@ -284,5 +302,5 @@ def _system_event(intent_name: str) -> str:
     'E_TEST_INTENT_NAME'
     """
     # TODO: This is only used in Dialogflow -> Deprecate and move to DialogflowConnector
-    event_name = "E_" + intent_name.upper().replace('.', '_')
+    event_name = sys.intern("E_" + intent_name.upper().replace('.', '_'))
     return event.SystemEvent(event_name)
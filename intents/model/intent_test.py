@@ -1,10 +1,11 @@
-from typing import List
+import sys
+from typing import List, Optional
 from dataclasses import field
 
 import pytest
 
 from intents import Intent, Sys
-from intents.model.intent import IntentParameterMetadata
+from intents.model.intent import IntentParameterMetadata, _is_valid_intent_name, _intent_name_from_class
 from intents.service_connector import Prediction
 from intents import language
 
@@ -55,6 +56,54 @@ def test_param_scheme_with_params():
         ),
     }
 
+def test_param_scheme_is_cached():
+
+    class intent_with_cached_params(Intent):
+        """Intent with parameters"""
+        required_param: Sys.Person
+
+    assert intent_with_cached_params.parameter_schema() is intent_with_cached_params.parameter_schema()
+
+    with pytest.raises(TypeError):
+        intent_with_cached_params.parameter_schema()["another_param"] = None
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="PEP 585 generics require Python 3.9")
+def test_param_scheme_builtin_list():
+
+    class intent_with_builtin_list(Intent):
+        """Intent with a PEP 585 list parameter"""
+        list_param: list[Sys.Person]
+
+    assert intent_with_builtin_list.parameter_schema()["list_param"].entity_cls == Sys.Person
+    assert intent_with_builtin_list.parameter_schema()["list_param"].is_list
+
+def test_param_scheme_invalid_typing():
+
+    with pytest.raises(ValueError):
+
+        class intent_with_invalid_typing(Intent):
+            """Intent with an unsupported typing modifier"""
+            optional_param: Optional[Sys.Person]
+
+def test_param_scheme_intent_subclass():
+
+    class parent_intent(Intent):
+        """Intent with parameters"""
+        required_param: Sys.Person
+
+    class child_intent_no_fields(parent_intent):
+        """Subclass that declares no new parameters"""
+        name = "test.child_intent_no_fields"
+
+    class child_intent_new_fields(parent_intent):
+        """Subclass that declares a new parameter"""
+        name = "test.child_intent_new_fields"
+        optional_param: Sys.Person = "John"
+
+    assert list(child_intent_no_fields.parameter_schema()) == ["required_param"]
+    assert list(child_intent_new_fields.parameter_schema()) == ["required_param", "optional_param"]
+    assert child_intent_new_fields(required_param="Al").optional_param == "John"
+
 def test_param_scheme_invalid_list_default():
     
     with pytest.raises(ValueError):
@@ -93,6 +142,61 @@ def test_fulfillment_messages():
 
     predicted = fake_intent.from_prediction(mock_prediction)
 
+    assert predicted.confidence == 0.5
+    assert predicted.fulfillment_text == "Fake fulfillment text"
     assert predicted.fulfillment_messages() == mock_rich_messages
     assert predicted.fulfillment_messages(language.IntentResponseGroup.DEFAULT) == mock_default_messages
     assert predicted.fulfillment_messages(language.IntentResponseGroup.RICH) == mock_rich_messages
+
+def test_is_valid_intent_name():
+    assert _is_valid_intent_name("smalltalk.hello") == (True, None)
+    assert _is_valid_intent_name("smalltalk.hello_2") == (False, "must only contain letters, underscore or dot")
+    assert _is_valid_intent_name("_smalltalk.hello") == (False, "must start with a letter")
+    assert _is_valid_intent_name(".smalltalk.hello") == (False, "must start with a letter")
+    assert _is_valid_intent_name("smalltalk__hello") == (False, "must not contain __")
+    assert _is_valid_intent_name("smalltalk.hello\n") == (False, "must only contain letters, underscore or dot")
+
+def test_intent_name_from_class():
+    class user__says___hello(Intent):
+        """Intent with repeated underscores in its name"""
+
+    assert _intent_name_from_class(user__says___hello) == "intent_test.user_says_hello"
+
+def test_intent_events():
+    from example_agent import smalltalk
+    from intents.model.event import SystemEvent
+
+    assert smalltalk.hello.events == (SystemEvent("E_SMALLTALK_HELLO"),)
+    assert smalltalk.agent_welcomes_user.events == (
+        SystemEvent("E_SMALLTALK_AGENT_WELCOMES_USER"),
+        smalltalk.WelcomeEvent
+    )
+
+def test_fulfillment_messages_rich_fallback():
+    class MockPredictionImplementation(Prediction):
+        @property
+        def entity_mappings(self):
+            return None
+
+    mock_default_messages = [
+        language.TextIntentResponse(choices=["If you like I can recommend you an hotel. Or I can send you some holiday pictures"])
+    ]
+    mock_prediction = MockPredictionImplementation(
+        intent_name='fake_intent_name',
+        confidence=0.5,
+        contexts={},
+        parameters_dict={},
+        fulfillment_messages={
+            language.IntentResponseGroup.DEFAULT: mock_default_messages
+        },
+        fulfillment_text="Fake fulfillment text"
+    )
+
+    class fake_intent_no_rich(Intent):
+        pass
+
+    predicted = fake_intent_no_rich.from_prediction(mock_prediction)
+
+    assert predicted.fulfillment_messages() == mock_default_messages
+    assert predicted.fulfillment_messages(language.IntentResponseGroup.DEFAULT) == mock_default_messages
+    assert predicted.fulfillment_messages(language.IntentResponseGroup.RICH) == mock_default_messages
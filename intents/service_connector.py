@@ -142,7 +142,11 @@ class Prediction(ABC):
     """
     This class is meant to abstract prediction results from a generic Prediction
     Service. It uses names from Dialogflow, as it is currently the only
-    supported service
+    supported service.
+
+    When no :const:`IntentResponseGroup.RICH` messages are predicted, the
+    `RICH` group of `fulfillment_messages` is filled with the
+    :const:`IntentResponseGroup.DEFAULT` messages.
     """
     intent_name: str
     confidence: str
@@ -151,6 +155,14 @@ class Prediction(ABC):
     fulfillment_messages: Dict[IntentResponseGroup, List[IntentResponse]]
     fulfillment_text: str = None
 
+    def __post_init__(self):
+        # Predictions without rich messages fall back to the default ones
+        if not self.fulfillment_messages.get(IntentResponseGroup.RICH):
+            self.fulfillment_messages = {
+                **self.fulfillment_messages,
+                IntentResponseGroup.RICH: self.fulfillment_messages.get(IntentResponseGroup.DEFAULT, [])
+            }
+
     @property
     @abstractmethod
     def entity_mappings(self) -> ServiceEntityMappings: